@@ -1,3 +1,5 @@
+import spotify_recommender_api.util as util
+
 from dataclasses import dataclass
 from spotify_recommender_api.requests.api_handler import ArtistHandler
 
@@ -44,3 +46,22 @@ class Artist:
 
         return list(set(genres))
 
+    @staticmethod
+    def get_genres_by_artist(artists_id: 'list[str]') -> 'dict[str, list[str]]':
+        """Function to return the list of genres of each artist, requesting them in batches of 50 artists
+
+        Args:
+            artists_id (list[str]): The artist ids
+
+        Returns:
+            dict[str, list[str]]: The list of genres attached to each artist, by artist id
+        """
+        genres_by_artist = {}
+
+        for artists_id_chunk in util.chunk_list(artists_id, 50):
+            response = ArtistHandler.batch_get_artist(artists_id_chunk).json()
+
+            for artist in response['artists']:
+                genres_by_artist[artist['id']] = artist['genres']
+
+        return genres_by_artist
@@ -2,6 +2,7 @@ import pytz
 import logging
 import datetime
 import contextlib
+import spotify_recommender_api.util as util
 
 from typing import Union, Any
 from spotify_recommender_api.requests import LibraryHandler, PlaylistHandler
@@ -436,7 +437,7 @@ class Library:
         for offset in range(0, total_playlist_count, 50):
             request = LibraryHandler.library_playlists(limit=50, offset=offset).json()
 
-            playlists += [(playlist['id'], playlist['name'], playlist['description']) for playlist in request['items']]
+            playlists.extend((playlist['id'], playlist['name'], playlist['description']) for playlist in request['items'])
 
         return next(
             (
@@ -566,15 +567,6 @@ class Library:
             full_uris (str): list of song uri's
             playlist_id (str): playlist id
         """
-        full_uris_list = full_uris.split(',')
-
-        if len(full_uris_list) <= 100:
-            uris = ','.join(full_uris_list)
-
-            PlaylistHandler.insert_songs_in_playlist(playlist_id=playlist_id, uris=uris)
-
-        else:
-            for offset in range(0, len(full_uris_list), 100):
-                uris = ','.join(full_uris_list[offset:offset + min(len(full_uris_list) - offset, 100)])
-
-                PlaylistHandler.insert_songs_in_playlist(playlist_id=playlist_id, uris=uris)
+        # the API accepts at most 100 songs per insertion request
+        for uris_chunk in util.chunk_list(full_uris.split(','), 100):
+            PlaylistHandler.insert_songs_in_playlist(playlist_id=playlist_id, uris=','.join(uris_chunk))
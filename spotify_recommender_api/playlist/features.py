@@ -628,7 +628,7 @@ class PlaylistFeatures:
 
         url = cls._build_recommendation_url(url, main_criteria, tracks, genres, artists, audio_statistics)
 
-        recommendations = RequestHandler.get_request(url=url).json()
+        recommendations = RequestHandler.get_json(url=url)
 
         songs = SongUtil._build_song_objects(recommendations=recommendations)
         recommendations_playlist = pd.DataFrame(data=songs)
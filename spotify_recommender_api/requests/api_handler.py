@@ -1,6 +1,7 @@
 import requests
+import contextlib
 
-from typing import Any, Union
+from typing import Any, Iterator, Union
 from spotify_recommender_api.requests.request_handler import RequestHandler, BASE_URL
 
 
@@ -225,6 +226,48 @@ class SongHandler:
 class UserHandler:
     """Class for handling Spotify user-related API requests."""
 
+    _top_items_cache: 'Union[dict[str, requests.Response], None]' = None
+
+    @classmethod
+    @contextlib.contextmanager
+    def top_items_cache(cls) -> Iterator[None]:
+        """
+        Context manager within which the responses of the user's top tracks and artists requests are cached,
+        so that a batch of operations that asks repeatedly for the same top items only requests them once.
+
+        Yields:
+            None
+        """
+        cls._top_items_cache = {}
+        try:
+            yield
+        finally:
+            cls._top_items_cache = None
+
+    @classmethod
+    def _cached_top_items_request(cls, url: str) -> requests.Response:
+        """
+        Get the user's top items, reusing the cached response when inside the top_items_cache context manager.
+
+        Args:
+            url (str): The top items request URL.
+
+        Returns:
+            requests.Response: The response object containing the user's top items.
+        """
+        if cls._top_items_cache is None:
+            return RequestHandler.get_request(url=url)
+
+        if url in cls._top_items_cache:
+            return cls._top_items_cache[url]
+
+        response = RequestHandler.get_request(url=url)
+
+        if response is not None and response.status_code == 200:  # only successful responses are reused
+            cls._top_items_cache[url] = response
+
+        return response
+
     @staticmethod
     def search(search_type: str, query: str, limit: int = 1) -> requests.Response:
         """
@@ -243,8 +286,8 @@ class UserHandler:
 
         return RequestHandler.get_request(url=f'{BASE_URL}/search?q={query}&type={search_type}&{limit=!s}')
 
-    @staticmethod
-    def top_tracks(time_range: str = 'short_term', limit: int = 1) -> requests.Response:
+    @classmethod
+    def top_tracks(cls, time_range: str = 'short_term', limit: int = 1) -> requests.Response:
         """
         Get the user's top tracks.
 
@@ -259,10 +302,10 @@ class UserHandler:
         if time_range not in {'long_term', 'medium_term', 'short_term'}:
             raise ValueError("Time range must be one of 'long_term', 'medium_term', 'short_term'")
 
-        return RequestHandler.get_request(url=f'{BASE_URL}/me/top/tracks?{time_range=!s}&{limit=!s}')
+        return cls._cached_top_items_request(url=f'{BASE_URL}/me/top/tracks?{time_range=!s}&{limit=!s}')
 
-    @staticmethod
-    def top_artists(time_range: str = 'short_term', limit: int = 1) -> requests.Response:
+    @classmethod
+    def top_artists(cls, time_range: str = 'short_term', limit: int = 1) -> requests.Response:
         """
         Get the user's top artists.
 
@@ -277,7 +320,7 @@ class UserHandler:
         if time_range not in {'long_term', 'medium_term', 'short_term'}:
             raise ValueError("Time range must be one of 'long_term', 'medium_term', 'short_term'")
 
-        return RequestHandler.get_request(url=f'{BASE_URL}/me/top/artists?{time_range=!s}&{limit=!s}')
+        return cls._cached_top_items_request(url=f'{BASE_URL}/me/top/artists?{time_range=!s}&{limit=!s}')
 
     @staticmethod
     def get_recently_played_songs(before: int, limit: int) -> requests.Response:
@@ -3,14 +3,24 @@ import time
 import logging
 import requests
 import functools
+import threading
 
 from typing import Union, Callable, Any
+from requests.adapters import HTTPAdapter
 from spotify_recommender_api.auth import AuthenticationHandler
 from spotify_recommender_api.requests.auth_handler import AuthHandler
 from spotify_recommender_api.server.sensitive import CLIENT_ID, CLIENT_SECRET
 from spotify_recommender_api.error import HTTPRequestError, TooManyRequestsError, AccessTokenExpiredError
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster, JSON decoder
+    orjson = None
+
 BASE_URL = 'https://api.spotify.com/v1'
+SESSION = requests.Session()  # reused across requests, including the ones made from the thread pools, so that the connections to the API are kept alive
+SESSION.mount('https://', HTTPAdapter(pool_maxsize=10))  # keeps a connection for each of the at most 8 concurrent workers, with some slack
+AUTH_LOCK = threading.Lock()  # serializes the access token renewal, so that it is renewed only once when several threads find it expired
 
 class RequestHandler:
     """Class for handling API requests."""
@@ -29,13 +39,17 @@ class RequestHandler:
         def wrapper(cls, *args: Any, **kwargs: Any) -> Any:
             value = None
             for error_count in range(3):
+                authorization = AuthenticationHandler._headers.get('Authorization')
                 try:
                     value = func(cls, *args, **kwargs)
 
                 except AccessTokenExpiredError as e:
                     logging.warning('Error due to the access token expiration')
 
-                    RequestHandler.get_auth()
+                    with AUTH_LOCK:
+                        # another thread may have already renewed the token while this one waited for the lock
+                        if AuthenticationHandler._headers.get('Authorization') == authorization:
+                            RequestHandler.get_auth()
 
                     if error_count >= 2:
                         raise
@@ -209,7 +223,36 @@ class RequestHandler:
         Returns:
             dict: Request response
         """
-        return cls.exponential_backoff(func=requests.get, url=url, headers=AuthenticationHandler._headers, retries=retries)
+        return cls.exponential_backoff(func=SESSION.get, url=url, headers=AuthenticationHandler._headers, retries=retries)
+
+    @classmethod
+    def get_json(cls, url: str, retries: int = 5) -> Any:
+        """GET request with integrated exponential backoff retry strategy, which returns the decoded JSON body.
+        The body is decoded with orjson, when it is installed, which is considerably faster on big payloads, such as recommendations
+
+        Args:
+            url (str): Request URL
+            retries (int, optional): Number of retries. Defaults to 5.
+
+        Returns:
+            Any: Decoded response body
+        """
+        return cls.decode_json(cls.get_request(url=url, retries=retries))
+
+    @staticmethod
+    def decode_json(response: requests.Response) -> Any:
+        """Decodes the JSON body of a response, with orjson when it is installed, falling back to the response's own decoder
+
+        Args:
+            response (requests.Response): Request response
+
+        Returns:
+            Any: Decoded response body
+        """
+        if orjson is None:
+            return response.json()
+
+        return orjson.loads(response.content)
 
     @classmethod
     def post_request(cls, url: str, data: Union[dict, None] = None, retries: int = 5) -> requests.Response:
@@ -223,7 +266,7 @@ class RequestHandler:
         Returns:
             dict: Request response
         """
-        return cls.exponential_backoff(func=requests.post, url=url, headers=AuthenticationHandler._headers, data=json.dumps(data), retries=retries)
+        return cls.exponential_backoff(func=SESSION.post, url=url, headers=AuthenticationHandler._headers, data=json.dumps(data), retries=retries)
 
     @classmethod
     def post_request_dict(cls, url: str, data: Union[dict, None] = None, retries: int = 5) -> requests.Response:
@@ -237,7 +280,7 @@ class RequestHandler:
         Returns:
             dict: Request response
         """
-        return cls.exponential_backoff(func=requests.post, url=url, headers=AuthenticationHandler._headers, data=data, retries=retries)
+        return cls.exponential_backoff(func=SESSION.post, url=url, headers=AuthenticationHandler._headers, data=data, retries=retries)
 
     @classmethod
     def put_request(cls, url: str, data: Union[dict, None] = None, retries: int = 5) -> requests.Response:
@@ -251,7 +294,7 @@ class RequestHandler:
         Returns:
             dict: Request response
         """
-        return cls.exponential_backoff(func=requests.put, url=url, headers=AuthenticationHandler._headers, data=json.dumps(data), retries=retries)
+        return cls.exponential_backoff(func=SESSION.put, url=url, headers=AuthenticationHandler._headers, data=json.dumps(data), retries=retries)
 
     @classmethod
     def delete_request(cls, url: str, data: Union[dict, None] = None, retries: int = 5) -> requests.Response:
@@ -265,7 +308,7 @@ class RequestHandler:
         Returns:
             dict: Request response
         """
-        return cls.exponential_backoff(func=requests.delete, url=url, headers=AuthenticationHandler._headers, data=json.dumps(data), retries=retries)
+        return cls.exponential_backoff(func=SESSION.delete, url=url, headers=AuthenticationHandler._headers, data=json.dumps(data), retries=retries)
 
     @classmethod
     def get_request_no_retry(cls, url: str) -> requests.Response:
@@ -278,4 +321,4 @@ class RequestHandler:
         Returns:
             dict: Request response
         """
-        return requests.get(url=url, headers=AuthenticationHandler._headers)
+        return SESSION.get(url=url, headers=AuthenticationHandler._headers)
@@ -4,20 +4,27 @@ import pandas as pd
 import spotify_recommender_api.util as util
 
 from typing import Union
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from spotify_recommender_api.song import SongUtil
 from spotify_recommender_api.user.util import UserUtil
 from spotify_recommender_api.playlist import BasePlaylist
-from spotify_recommender_api.requests import RequestHandler, PlaylistHandler, UserHandler
+from spotify_recommender_api.requests import PlaylistHandler, RequestHandler, UserHandler
 
 RECENTLY_PLAYED_MAX_NUMBER  = 1500
 RECENTLY_PLAYED_CRITERIAS   = ['mixed', 'artists', 'genres']
 MOST_LISTENED_TIME_RANGES   = ['long_term', 'medium_term', 'short_term']
 RECENTLY_PLAYED_TIME_RANGES = ['last-30-minutes', 'last-hour', 'last-3-hours', 'last-6-hours', 'last-12-hours', 'last-day', 'last-3-days', 'last-week', 'last-2-weeks', 'last-month', 'last-3-months', 'last-6-months', 'last-year']
+PROFILE_RECOMMENDATION_TYPES = {
+    'long_term': 'long-term-profile-recommendation',
+    'short_term': 'short-term-profile-recommendation',
+    'medium_term': 'medium-term-profile-recommendation',
+}
 
 @dataclass
 class User:
+    __slots__ = ('user_id',)
+
     user_id: str
 
     @staticmethod
@@ -45,7 +52,7 @@ class User:
         Returns:
             pd.DataFrame: pandas DataFrame containing the top number_of_songs songs in the time range
         """
-        top = UserHandler.top_tracks(time_range=time_range, limit=number_of_songs).json()
+        top = RequestHandler.decode_json(UserHandler.top_tracks(time_range=time_range, limit=number_of_songs))
 
         top_songs = SongUtil._build_song_objects(
             dict_key='items',
@@ -84,7 +91,7 @@ class User:
             if not _auto:
                 logging.info(f'No songs found in the {time_range} time range')
             else:
-                logging.debug(f'No songs found in the {time_range} time range')
+                logging.debug('No songs found in the %s time range', time_range)
             return
 
         return UserUtil._build_playlist_df(
@@ -125,19 +132,19 @@ class User:
         """
         artists, genres = UserUtil._get_recently_played_artists_genres(time_range)
 
-        if not artists + genres:
+        if not artists and not genres:
             if not _auto:
                 logging.info(f'No songs found in the {time_range} time range')
             else:
-                logging.debug(f'No songs found in the {time_range} time range')
+                logging.debug('No songs found in the %s time range', time_range)
             return
 
-        artists = [artist for artist, _ in Counter(artists).most_common(5)]
-        genres = [genre for genre, _ in Counter(genres).most_common(5)]
+        artists = [artist for artist, _ in artists.most_common(5)]
+        genres = [genre for genre, _ in genres.most_common(5)]
 
         url = UserUtil._build_recommendations_url_recently_played(number_of_songs, main_criteria, artists, genres)
 
-        recommendations = RequestHandler.get_request(url=url).json()
+        recommendations = UserUtil._get_recommendations(url)
         songs = SongUtil._build_song_objects(recommendations)
 
         return UserUtil._build_playlist_df(
@@ -177,12 +184,16 @@ class User:
         """
         UserUtil._validate_input_parameters(number_of_songs, main_criteria, time_range)
 
-        artists, genres = UserUtil._get_top_artists_genres(main_criteria, time_range)
-        tracks = UserUtil._get_top_tracks(main_criteria, time_range)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            top_artists_genres = executor.submit(UserUtil._get_top_artists_genres, main_criteria, time_range)
+            top_tracks = executor.submit(UserUtil._get_top_tracks, main_criteria, time_range)
+
+            artists, genres = top_artists_genres.result()
+            tracks = top_tracks.result()
 
         url = UserUtil._build_recommendations_url(number_of_songs, main_criteria, artists, genres, tracks)
 
-        recommendations = RequestHandler.get_request(url=url).json()
+        recommendations = UserUtil._get_recommendations(url)
         songs = SongUtil._build_song_objects(recommendations)
 
         return UserUtil._build_playlist_df(
@@ -227,7 +238,7 @@ class User:
 
         songs = SongUtil._build_song_objects(recommendations=recommendations)
 
-        types = ' and '.join(', '.join(types).rsplit(', ', 1)) if len(types) > 1 else types[0]
+        types = util.join_with_and(types)
 
         return UserUtil._build_playlist_df(
             data=songs,
@@ -252,39 +263,45 @@ class User:
             playlist_types_to_update (Union[list[str], None], optional): List of playlist types to update. Defaults to None.
             playlist_types_not_to_update (Union[list[str], None], optional): List of playlist types not to update. Defaults to None.
         """
-        playlist_types_to_update = UserUtil._get_playlist_types_to_update(playlist_types_to_update, playlist_types_not_to_update)
-        playlists = UserUtil._get_playlists_to_update(base_playlist=base_playlist, playlist_types_to_update=playlist_types_to_update)
+        playlist_types = UserUtil._get_playlist_types_to_update(playlist_types_to_update, playlist_types_not_to_update)
+        playlists = UserUtil._get_playlists_to_update(base_playlist=base_playlist, playlist_types_to_update=playlist_types)
 
         playlist_count = len(playlists)
 
         if not playlist_count:
             logging.info('No playlist found to be updated, given the playlist type filters')
 
-        logging.info('Starting to update playlists')
-        util.progress_bar(0, playlist_count, suffix=f'0/{playlist_count}', percentage_precision=1)
-        for index, (playlist_id, name, description, total_tracks) in enumerate(playlists):
-            try:
-
-                util.progress_bar(index, playlist_count, suffix=f'{index}/{playlist_count}', percentage_precision=1)
+        playlist_updaters = {
+            'most-listened-tracks': lambda playlist_id, name, description, total_tracks: self.update_most_listened_playlist(total_tracks, name),
+            'recently-played': lambda playlist_id, name, description, total_tracks: self.update_recently_played_playlist(total_tracks, name, description),
+            'recently-played-recommendations': lambda playlist_id, name, description, total_tracks: self.update_recently_played_recommendations_playlist(total_tracks, name),
+            'profile-recommendation': lambda playlist_id, name, description, total_tracks: self.update_profile_recommendation_playlist(playlist_types, playlist_id, name, description, total_tracks),
+            'base-playlist': lambda playlist_id, name, description, total_tracks: UserUtil._update_base_playlist(name, description, total_tracks, base_playlist, playlist_types),
+        }
+        base_playlist_name = None if base_playlist is None else base_playlist.playlist_name
 
-                if UserUtil._should_update_most_listened(name, playlist_types_to_update):
-                    self.update_most_listened_playlist(total_tracks, name)
-
-                elif UserUtil._should_update_recently_played(name, playlist_types_to_update):
-                    self.update_recently_played_playlist(total_tracks, name, description)
+        logging.info('Starting to update playlists')
+        progress_bar_step = max(1, playlist_count // 100)  # redraws the progress bar at most once per percent of the playlists
 
-                elif UserUtil._should_update_recently_played_recommendations(name, playlist_types_to_update):
-                    self.update_recently_played_recommendations_playlist(total_tracks, name)
+        playlist_kinds = [
+            UserUtil._classify_playlist(name, description, playlist_types, base_playlist_name)
+            for _, name, description, _ in playlists
+        ]
 
-                elif UserUtil._should_update_profile_recommendation(name, playlist_types_to_update):
-                    self.update_profile_recommendation_playlist(playlist_types_to_update, playlist_id, name, description, total_tracks)
+        with UserHandler.top_items_cache():
+            util.progress_bar(0, playlist_count, suffix=f'0/{playlist_count}', percentage_precision=1)
+            for index, ((playlist_id, name, description, total_tracks), playlist_kind) in enumerate(zip(playlists, playlist_kinds)):
+                if index % progress_bar_step == 0:
+                    util.progress_bar(index, playlist_count, suffix=f'{index}/{playlist_count}', percentage_precision=1)
 
-                elif base_playlist is not None and UserUtil._should_update_base_playlist(name, description, base_playlist.playlist_name):
-                    UserUtil._update_base_playlist(name, description, total_tracks, base_playlist, playlist_types_to_update)
+                try:
+                    if playlist_kind is not None:
+                        playlist_updaters[playlist_kind](playlist_id, name, description, total_tracks)
 
-            except Exception as e:
-                logging.error(f"Unfortunately we couldn't update the playlist {name} because\n {e} ")
-                logging.debug(traceback.format_exc())
+                except Exception as e:
+                    logging.error(f"Unfortunately we couldn't update the playlist {name} because\n {e} ")
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(traceback.format_exc())
 
         util.progress_bar(playlist_count, playlist_count, suffix=f'{playlist_count}/{playlist_count}', percentage_precision=1)
         print()
@@ -300,7 +317,7 @@ class User:
         self.get_most_listened(
             build_playlist=True,
             number_of_songs=total_tracks,
-            time_range='_'.join(name.split(" ")[:2]).lower(),
+            time_range=UserUtil._parse_term_time_range(name),
         )
 
     def update_recently_played_playlist(self, total_tracks: int, name: str, description: str) -> None:
@@ -314,7 +331,7 @@ class User:
             _auto=True,
             build_playlist=True,
             number_of_songs=True if description.startswith('All ') else total_tracks,
-            time_range='-'.join(name.split("Recently played songs in the ")[-1].split(' ')).lower(),
+            time_range=UserUtil._parse_recently_played_time_range(name),
         )
 
     def update_recently_played_recommendations_playlist(self, total_tracks: int, name: str) -> None:
@@ -329,10 +346,10 @@ class User:
             build_playlist=True,
             number_of_songs=total_tracks,
             main_criteria=name.split('(')[-1].split(')')[0],
-            time_range='-'.join(name.split("Recently played recommendations in the ")[-1].split(' (')[0].split(' ')).lower(),
+            time_range=UserUtil._parse_recently_played_recommendations_time_range(name),
         )
 
-    def update_profile_recommendation_playlist(self, playlist_types_to_update: 'list[str]', playlist_id: str, name: str, description: str, total_tracks: int) -> None:
+    def update_profile_recommendation_playlist(self, playlist_types_to_update: 'frozenset[str]', playlist_id: str, name: str, description: str, total_tracks: int) -> None:
         """Update the profile recommendation playlist.
 
         Args:
@@ -353,7 +370,7 @@ class User:
 
             PlaylistHandler.update_playlist_details(playlist_id=playlist_id, data=data)
 
-        if f"{time_range.replace('_', '-')}-profile-recommendation" in playlist_types_to_update:
+        if PROFILE_RECOMMENDATION_TYPES.get(time_range) in playlist_types_to_update:
             self.get_profile_recommendation(
                 build_playlist=True,
                 time_range=time_range,
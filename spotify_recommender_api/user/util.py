@@ -1,13 +1,15 @@
 import re
 import html
-import time
 import logging
 import datetime
 import pandas as pd
 import spotify_recommender_api.util as util
 
-from typing import Union
-from functools import reduce
+from typing import Iterator, Union
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
 from spotify_recommender_api.song import Song
 from spotify_recommender_api.core import Library
 from spotify_recommender_api.artist import Artist
@@ -15,13 +17,48 @@ from spotify_recommender_api.playlist import BasePlaylist
 from spotify_recommender_api.requests import LibraryHandler, UserHandler, RequestHandler, BASE_URL
 
 TIME_OFFSET = util.get_time_offset()
+TIME_OFFSET_DELTA = datetime.timedelta(hours=TIME_OFFSET)
+RECENTLY_PLAYED_SONGS_PATTERN = re.compile(r'Recently played songs in the (.*)')
+RECENTLY_PLAYED_RECOMMENDATIONS_PATTERN = re.compile(r'Recently played recommendations in the (.*?)(?: \(|$)')
+SONG_RELATED_PATTERN = re.compile(r'''["'](.*?)["'] Related''')
+ARTIST_MIX_PATTERN = re.compile(r'''["'](.*?)["'] Mix''')
+ARTIST_FULL_PATTERN = re.compile(r'''This once was ["'](.*)["']''')
+DEFAULT_PLAYLIST_TYPES_TO_UPDATE = frozenset({
+    'most-listened-tracks', 'song-related', 'artist-mix', 'artist-full', 'playlist-recommendation',
+    'short-term-profile-recommendation', 'medium-term-profile-recommendation',
+    'long-term-profile-recommendation', 'mood', 'most-listened-recommendation', 'recently-played',
+    'recently-played-recommendations'
+})
+RECENTLY_PLAYED_TIME_RANGE_DELTAS = {
+    'last-30-minutes': datetime.timedelta(minutes=30),
+    'last-hour': datetime.timedelta(hours=1),
+    'last-3-hours': datetime.timedelta(hours=3),
+    'last-6-hours': datetime.timedelta(hours=6),
+    'last-12-hours': datetime.timedelta(hours=12),
+    'last-day': datetime.timedelta(days=1),
+    'last-3-days': datetime.timedelta(days=3),
+    'last-week': datetime.timedelta(weeks=1),
+    'last-2-weeks': datetime.timedelta(weeks=2),
+    'last-month': datetime.timedelta(days=30),
+    'last-3-months': datetime.timedelta(days=90),
+    'last-6-months': datetime.timedelta(days=180),
+    'last-year': datetime.timedelta(days=365),
+}
+MOST_LISTENED_PLAYLIST_NAMES = frozenset({'Long Term Most-listened Tracks', 'Medium Term Most-listened Tracks', 'Short Term Most-listened Tracks'})
+PROFILE_RECOMMENDATION_PLAYLIST_TYPES = frozenset({'short-term-profile-recommendation', 'medium-term-profile-recommendation', 'long-term-profile-recommendation'})
+BASE_PLAYLIST_NAME_MARKERS_PATTERN = re.compile(r'Related|Mix|This once was|Playlist Recommendation|most listened recommendations')
+RECOMMENDATION_AUDIO_FEATURES = ('tempo', 'energy', 'valence', 'danceability', 'instrumentalness')
+BASE_PLAYLIST_NAME_PATTERN = re.compile('|'.join(
+    f'(?P<{group_name}>{pattern.pattern})'
+    for group_name, pattern in (('song_related', SONG_RELATED_PATTERN), ('artist_mix', ARTIST_MIX_PATTERN), ('artist_full', ARTIST_FULL_PATTERN))
+))
 
 
 class UserUtil:
     """Class for utility methods regarding song operations"""
 
     @classmethod
-    def _update_base_playlist(cls, name: str, description: str, total_tracks: int, base_playlist: BasePlaylist, playlist_types_to_update: 'list[str]') -> None:
+    def _update_base_playlist(cls, name: str, description: str, total_tracks: int, base_playlist: BasePlaylist, playlist_types_to_update: 'frozenset[str]') -> None:
         """Update the base playlist.
 
         Args:
@@ -29,40 +66,39 @@ class UserUtil:
             description (str): Description of the playlist.
             total_tracks (int): Total number of tracks.
             base_playlist (BasePlaylist): Base playlist object.
-            playlist_types_to_update (list[str]): List of playlist types to be updated.
+            playlist_types_to_update (frozenset[str]): List of playlist types to be updated.
         """
-        if cls._should_update_song_related(name, playlist_types_to_update):
-            song_name = name.replace(" Related", '')[1:-1]
-            try:
-                artist_name = ' by '.join(description.split(', within the playlist')[0].split(' by ')[1:])  # joining just in case the artist name has " by " in it
-            except Exception:
-                artist_name = ''
-            cls._update_song_related(base_playlist, song_name, artist_name, total_tracks)
+        playlist_type = cls._classify_base_playlist(name, description)
 
-        elif cls._should_update_artist_mix(name, playlist_types_to_update):
-            artist_name = name.replace(" Mix", '')[1:-1]
-            cls._update_artist_mix(base_playlist, artist_name, total_tracks)
+        if playlist_type is not None and playlist_type in playlist_types_to_update:
+            BASE_PLAYLIST_UPDATERS[playlist_type](base_playlist, name, description, total_tracks)
 
-        elif cls._should_update_artist_full(name, playlist_types_to_update):
-            artist_name = name.replace("This once was ", '')[1:-1]
-            ensure_all_artist_songs = f'All {artist_name}' in description or not description
-            cls._update_artist_full(base_playlist, artist_name, total_tracks, ensure_all_artist_songs)
+    @staticmethod
+    def _classify_base_playlist(name: str, description: str) -> Union[str, None]:
+        """Classifies a playlist created from the base playlist by its type, matching the quoted names with a single pattern.
+
+        Args:
+            name (str): Name of the playlist.
+            description (str): Description of the playlist.
 
-        elif cls._should_update_playlist_recommendation(name, playlist_types_to_update):
-            criteria, time_range = cls._parse_playlist_recommendation(name)
-            cls._update_playlist_recommendation(base_playlist, time_range, criteria, total_tracks)
+        Returns:
+            Union[str, None]: The playlist type, as in the playlist_types_to_update, or None if it is not a base playlist derived playlist.
+        """
+        name_match = BASE_PLAYLIST_NAME_PATTERN.match(name)
 
-        elif cls._should_update_songs_by_mood(description, playlist_types_to_update):
-            mood = ' '.join(name.split(' ')[:-1]).lower()
-            exclude_mostly_instrumental = 'excluding the mostly instrumental songs' in description
-            cls._update_songs_by_mood(base_playlist, mood, total_tracks, exclude_mostly_instrumental)
+        if name_match is not None:
+            return name_match.lastgroup.replace('_', '-')  # type: ignore
 
-        elif cls._should_update_most_listened_recommendation(name, playlist_types_to_update):
-            time_range = '_'.join(name.split(' ')[:2]).lower()
-            cls._update_most_listened_recommendation(base_playlist, time_range, total_tracks)
+        if 'Playlist Recommendation' in name and ' - 20' not in name:
+            return 'playlist-recommendation'
 
+        if 'Songs related to the mood' in description:
+            return 'mood'
 
+        if 'most listened recommendations' in name:
+            return 'most-listened-recommendation'
 
+        return None
 
     @classmethod
     def _build_url(
@@ -112,7 +148,9 @@ class UserUtil:
         Returns:
             str: Updated URL.
         """
-        artists = [cls._get_artist_id(artist) for artist in artists_info]
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            artists = list(executor.map(cls._get_artist_id, artists_info))
+
         url += f'&seed_artists={",".join(artists)}'
 
         return url
@@ -128,12 +166,18 @@ class UserUtil:
         Returns:
             str: Updated URL.
         """
+        # the track information is homogeneous, so its format is checked only once
         if isinstance(tracks_info, dict):
-            tracks_info = tracks_info.items()  # type: ignore
-        for track_info in tracks_info:
-            song, artist = track_info if isinstance(track_info, (tuple, list)) else (track_info, '')
-            track_id = cls._get_track_id(song, artist)
-            url += f'&seed_tracks={track_id}'
+            songs, artists = list(tracks_info.keys()), list(tracks_info.values())
+        elif isinstance(tracks_info[0], (tuple, list)):
+            songs, artists = [track_info[0] for track_info in tracks_info], [track_info[1] for track_info in tracks_info]
+        else:
+            songs, artists = tracks_info, [''] * len(tracks_info)
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            track_ids = list(executor.map(cls._get_track_id, songs, artists))
+
+        url += f'&seed_tracks={",".join(track_ids)}'
 
         return url
 
@@ -177,9 +221,9 @@ class UserUtil:
         genres = []
 
         if main_criteria != 'tracks':
-            top_artists_req = UserHandler.top_artists(time_range=time_range, limit=5).json()['items']
+            top_artists_req = RequestHandler.decode_json(UserHandler.top_artists(time_range=time_range, limit=5))['items']
             artists = [artist['id'] for artist in top_artists_req]
-            genres = list(set(reduce(lambda x, y: x + y, [artist['genres'] for artist in top_artists_req], [])))[:5]
+            genres = list({genre for artist in top_artists_req for genre in artist['genres']})[:5]
 
         return artists, genres
 
@@ -198,7 +242,7 @@ class UserUtil:
         if main_criteria not in ['artists']:
             return [
                 track['id']
-                for track in UserHandler.top_tracks(time_range=time_range, limit=5).json()['items']
+                for track in RequestHandler.decode_json(UserHandler.top_tracks(time_range=time_range, limit=5))['items']
             ]
         return []
 
@@ -255,12 +299,12 @@ class UserUtil:
         return url
 
     @staticmethod
-    def _playlist_needs_update(playlist: 'tuple[str, str, str, int]', playlist_types_to_update: 'list[str]', base_playlist_name: Union[str, None] = None) -> bool:
+    def _playlist_needs_update(playlist: 'tuple[str, str, str, int]', playlist_types_to_update: 'frozenset[str]', base_playlist_name: Union[str, None] = None) -> bool:
         """Function to determine if a playlist inside the user's library needs to be updated
 
         Args:
             playlist (tuple[str, str, str, str]): Playlist information
-            playlist_types_to_update (list[str]): Playlist types to be updated
+            playlist_types_to_update (frozenset[str]): Playlist types to be updated
             base_playlist_name (str, optional): Name of the base playlist. Defaults to None.
 
         Returns:
@@ -268,16 +312,18 @@ class UserUtil:
         """
         _, name, description, _ = playlist
 
-        if name in {'Long Term Most-listened Tracks', 'Medium Term Most-listened Tracks', 'Short Term Most-listened Tracks'} and 'most-listened-tracks' in playlist_types_to_update:
+        is_base_playlist_derived = base_playlist_name is not None and (not description or f', within the playlist {base_playlist_name}' in description)
+
+        if not is_base_playlist_derived and 'Most-listened Tracks' not in name and 'Profile Recommendation' not in name and 'Recently played ' not in name:
+            return False
+
+        if name in MOST_LISTENED_PLAYLIST_NAMES and 'most-listened-tracks' in playlist_types_to_update:
             return True
 
         elif (
             ' - 20' not in name and
             'Profile Recommendation' in name and
-            any(
-                playlist_type in playlist_types_to_update
-                for playlist_type in {'short-term-profile-recommendation', 'medium-term-profile-recommendation', 'long-term-profile-recommendation'}
-            )
+            not PROFILE_RECOMMENDATION_PLAYLIST_TYPES.isdisjoint(playlist_types_to_update)
         ):
             return True
 
@@ -295,24 +341,10 @@ class UserUtil:
         ):
             return True
 
-        elif (not description or f', within the playlist {base_playlist_name}' in description) and base_playlist_name is not None:
-            if (re.match(r"\'(.*?)\' Related", name) or re.match(r'\"(.*?)\" Related', name)) and 'song-related' in playlist_types_to_update:
-                return True
-
-            elif (re.match(r"\'(.*?)\' Mix", name) or re.match(r'\"(.*?)\" Mix', name)) and 'artist-mix' in playlist_types_to_update:
-                return True
-
-            elif (re.match(r"This once was \'(.*?)\'", name) or re.match(r'This once was \"(.*?)\"', name)) and 'artist-full' in playlist_types_to_update:
-                return True
-
-            elif 'Playlist Recommendation' in name and ' - 20' not in name and 'playlist-recommendation' in playlist_types_to_update:
-                return True
-
-            elif 'Songs related to the mood' in description and 'mood' in playlist_types_to_update:
-                return True
+        elif is_base_playlist_derived and not BASE_PLAYLIST_UPDATERS.keys().isdisjoint(playlist_types_to_update):
+            playlist_type = UserUtil._classify_base_playlist(name, description)
 
-            elif 'most listened recommendations' in name and 'most-listened-recommendation' in playlist_types_to_update:
-                return True
+            return playlist_type is not None and playlist_type in playlist_types_to_update
 
         return False
 
@@ -327,7 +359,7 @@ class UserUtil:
         Returns:
             dict: The recommendations data.
         """
-        return RequestHandler.get_request(url=url).json()
+        return RequestHandler.get_json(url=url)
 
     @staticmethod
     def _build_description(
@@ -346,34 +378,29 @@ class UserUtil:
             tuple[str, list[str]]: The description and the types of seed data used.
         """
         types = []
-        description = 'General Recommendation based on '
+        seeds = []
 
         if artists_info:
             types.append('artists')
-            description += f'the {"artist" if len(artists_info) == 1 else "artists"} '
-            description += ' and '.join(', '.join(artists_info).rsplit(', ', 1))
+            seeds.append(f'the {"artist" if len(artists_info) == 1 else "artists"} {util.join_with_and(artists_info)}')
 
         if genres_info:
             types.append('genres')
-            if artists_info:
-                description += ' and ' if len(artists_info) >= 1 else ', '
-            description += f'the {"genre" if len(genres_info) == 1 else "genres"} '
-            description += ' and '.join(', '.join(genres_info).rsplit(', ', 1))
+            seeds.append(f'the {"genre" if len(genres_info) == 1 else "genres"} {util.join_with_and(genres_info)}')
 
         if tracks_info:
             types.append('tracks')
-            if artists_info or genres_info:
-                description += ' and ' if len(artists_info) + len(genres_info) >= 1 else ', '
-            description += f'the {"track" if len(tracks_info) == 1 else "tracks"} '
 
             if isinstance(tracks_info, dict):
-                description += ' and '.join(', '.join(list(tracks_info.keys())).rsplit(', ', 1))
+                track_names = list(tracks_info.keys())
             elif isinstance(tracks_info[0], (tuple, list)):
-                description += ' and '.join(', '.join([track_info[0] for track_info in tracks_info]).rsplit(', ', 1))
-            elif isinstance(tracks_info[0], str):
-                description += ' and '.join(', '.join(tracks_info).rsplit(', ', 1)) # type: ignore
+                track_names = [track_info[0] for track_info in tracks_info]
+            else:
+                track_names = tracks_info
+
+            seeds.append(f'the {"track" if len(tracks_info) == 1 else "tracks"} {util.join_with_and(track_names)}')  # type: ignore
 
-        return description, types
+        return f'General Recommendation based on {" and ".join(seeds)}', types
 
     @staticmethod
     def _add_audio_features(url: str, audio_statistics: 'dict[str, float]') -> str:
@@ -386,31 +413,17 @@ class UserUtil:
         Returns:
             str: The updated URL with audio features.
         """
-        min_tempo = audio_statistics['min_tempo'] * 0.8
-        max_tempo = audio_statistics['max_tempo'] * 1.2
-        target_tempo = audio_statistics['mean_tempo']
-        min_energy = audio_statistics['min_energy'] * 0.8
-        max_energy = audio_statistics['max_energy'] * 1.2
-        target_energy = audio_statistics['mean_energy']
-        min_valence = audio_statistics['min_valence'] * 0.8
-        max_valence = audio_statistics['max_valence'] * 1.2
-        target_valence = audio_statistics['mean_valence']
-        min_danceability = audio_statistics['min_danceability'] * 0.8
-        max_danceability = audio_statistics['max_danceability'] * 1.2
-        target_danceability = audio_statistics['mean_danceability']
-        min_instrumentalness = audio_statistics['min_instrumentalness'] * 0.8
-        max_instrumentalness = audio_statistics['max_instrumentalness'] * 1.2
-        target_instrumentalness = audio_statistics['mean_instrumentalness']
-
-        url += f'&min_tempo={min_tempo}&max_tempo={max_tempo}&target_tempo={target_tempo}'
-        url += f'&min_energy={min_energy}&max_energy={max_energy}&target_energy={target_energy}'
-        url += f'&min_valence={min_valence}&max_valence={max_valence}&target_valence={target_valence}'
-        url += f'&min_danceability={min_danceability}&max_danceability={max_danceability}&target_danceability={target_danceability}'
-        url += f'&min_instrumentalness={min_instrumentalness}&max_instrumentalness={max_instrumentalness}&target_instrumentalness={target_instrumentalness}'
+        audio_feature_params = [
+            f'&min_{feature}={audio_statistics[f"min_{feature}"] * 0.8}'
+            f'&max_{feature}={audio_statistics[f"max_{feature}"] * 1.2}'
+            f'&target_{feature}={audio_statistics[f"mean_{feature}"]}'
+            for feature in RECOMMENDATION_AUDIO_FEATURES
+        ]
 
-        return url
+        return url + ''.join(audio_feature_params)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _get_artist_id(artist: str) -> str:
         """Gets the Spotify ID of an artist.
 
@@ -440,6 +453,7 @@ class UserUtil:
         return url
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _get_track_id(song: str, artist: str) -> str:
         """Gets the Spotify ID of a track.
 
@@ -504,7 +518,7 @@ class UserUtil:
     def _get_playlist_types_to_update(
         playlist_types_to_update: 'Union[list[str], None]',
         playlist_types_not_to_update: 'Union[list[str], None]'
-    ) -> 'list[str]':
+    ) -> 'frozenset[str]':
         """Determines the types of playlists to update based on user preferences.
 
         Args:
@@ -512,41 +526,30 @@ class UserUtil:
             playlist_types_not_to_update (Union[list[str], None]): Playlist types not to be updated.
 
         Returns:
-            list[str]: The types of playlists to update.
+            frozenset[str]: The types of playlists to update.
         """
-        if playlist_types_to_update is None:
-            playlist_types_to_update = [
-                'most-listened-tracks', 'song-related', 'artist-mix', 'artist-full', 'playlist-recommendation',
-                'short-term-profile-recommendation', 'medium-term-profile-recommendation',
-                'long-term-profile-recommendation', 'mood', 'most-listened-recommendation', 'recently-played',
-                'recently-played-recommendations'
-            ]
+        excluded_playlist_types = frozenset(playlist_types_not_to_update or ())
 
-        if playlist_types_not_to_update is None:
-            playlist_types_not_to_update = []
-
-        playlist_types_to_update = [playlist_type for playlist_type in playlist_types_to_update if playlist_type not in playlist_types_not_to_update]
+        if playlist_types_to_update is None:
+            playlist_types = DEFAULT_PLAYLIST_TYPES_TO_UPDATE - excluded_playlist_types
+        else:
+            playlist_types = frozenset(playlist_types_to_update) - excluded_playlist_types
 
-        if 'profile-recommendation' in playlist_types_to_update:
+        if 'profile-recommendation' in playlist_types:
             logging.warning('After version 4.4.0, the profile-recommendation playlists are separated in short, medium and long term. See the update_all_created_playlists docstring or the documentation at: https://github.com/nikolas-virionis/spotify-api')
-            playlist_types_to_update.remove('profile-recommendation')
-            for playlist_type in {'short-term-profile-recommendation', 'medium-term-profile-recommendation', 'long-term-profile-recommendation'}:
-                if playlist_type not in playlist_types_to_update:
-                    playlist_types_to_update.append(playlist_type)
+            playlist_types = (playlist_types - {'profile-recommendation'}) | PROFILE_RECOMMENDATION_PLAYLIST_TYPES
 
-        if 'profile-recommendation' in playlist_types_not_to_update:
-            for playlist_type in {'profile-recommendation', 'short-term-profile-recommendation', 'medium-term-profile-recommendation', 'long-term-profile-recommendation'}:
-                if playlist_type in playlist_types_to_update:
-                    playlist_types_to_update.remove(playlist_type)
+        if 'profile-recommendation' in excluded_playlist_types:
+            playlist_types -= PROFILE_RECOMMENDATION_PLAYLIST_TYPES
 
-        return playlist_types_to_update
+        return playlist_types
 
     @classmethod
-    def _get_playlists_to_update(cls, playlist_types_to_update: 'list[str]', base_playlist: Union[BasePlaylist, None]) -> 'list[tuple[str, str, str, int]]':
+    def _get_playlists_to_update(cls, playlist_types_to_update: 'frozenset[str]', base_playlist: Union[BasePlaylist, None]) -> 'list[tuple[str, str, str, int]]':
         """Gets the playlists to update based on playlist types and base playlist.
 
         Args:
-            playlist_types_to_update (list[str]): Types of playlists to update.
+            playlist_types_to_update (frozenset[str]): Types of playlists to update.
             base_playlist (Union[BasePlaylist, None]): Base playlist object.
 
         Returns:
@@ -555,47 +558,78 @@ class UserUtil:
 
         logging.info('Starting to map the playlists which need to be updated')
 
-        total_playlist_count = LibraryHandler.get_total_playlist_count()
-        playlists = []
-
-        for offset in range(0, total_playlist_count, 50):
-            request = LibraryHandler.library_playlists(limit=50, offset=offset).json()
-            playlists += [(playlist['id'], playlist['name'], playlist['description'], playlist['tracks']['total'] or 50) for playlist in request['items']]
+        playlist_needs_update = partial(
+            cls._playlist_needs_update,
+            playlist_types_to_update=playlist_types_to_update,
+            base_playlist_name=None if base_playlist is None else base_playlist.playlist_name
+        )
 
-        playlists = [
-            playlist
-            for playlist in playlists
-            if cls._playlist_needs_update(
-                playlist=playlist,
-                playlist_types_to_update=playlist_types_to_update,
-                base_playlist_name=None if base_playlist is None else base_playlist.playlist_name
-            )
-        ]
+        playlists = list(filter(playlist_needs_update, cls._get_library_playlists()))
 
         logging.info('Playlists to be updated mapped successfully')
 
         return playlists
 
     @staticmethod
-    def _get_percentage_update(index: int, total_playlists: int) -> int:
-        """Calculates the percentage of playlists updated.
+    def _get_library_playlists() -> 'Iterator[tuple[str, str, str, int]]':
+        """Yields the playlists in the user's library, fetching the pages of results concurrently.
+
+        Returns:
+            Iterator[tuple[str, str, str, int]]: The id, name, description and total tracks of each playlist.
+        """
+        first_page = LibraryHandler.library_playlists(limit=50, offset=0).json()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pages = executor.map(
+                lambda offset: LibraryHandler.library_playlists(limit=50, offset=offset).json(),
+                range(50, first_page['total'], 50)
+            )
+
+            for page in chain((first_page,), pages):
+                for playlist in page['items']:
+                    yield playlist['id'], playlist['name'], playlist['description'], playlist['tracks']['total'] or 50
+
+    @classmethod
+    def _classify_playlist(cls, name: str, description: str, playlist_types_to_update: 'frozenset[str]', base_playlist_name: Union[str, None]) -> Union[str, None]:
+        """Classifies a playlist inside the user's library by the kind of update it needs.
 
         Args:
-            index (int): Index of the current playlist being updated.
-            total_playlists (int): Total number of playlists to update.
+            name (str): The name of the playlist.
+            description (str): The description of the playlist.
+            playlist_types_to_update (frozenset[str]): Types of playlists to update.
+            base_playlist_name (Union[str, None]): Name of the base playlist, if any.
 
         Returns:
-            int: The percentage of playlists updated.
+            Union[str, None]: One of 'most-listened-tracks', 'recently-played', 'recently-played-recommendations', 'profile-recommendation' or 'base-playlist', or None if the playlist does not need to be updated.
         """
-        return next((perc for perc in range(100, 0, -10) if (100 * index) / total_playlists >= perc), 100)
+        if cls._should_update_most_listened(name, playlist_types_to_update):
+            return 'most-listened-tracks'
+
+        if cls._should_update_recently_played(name, playlist_types_to_update):
+            return 'recently-played'
+
+        if cls._should_update_recently_played_recommendations(name, playlist_types_to_update):
+            return 'recently-played-recommendations'
+
+        if cls._should_update_profile_recommendation(name, playlist_types_to_update):
+            return 'profile-recommendation'
+
+        if (
+            base_playlist_name is not None and
+            not BASE_PLAYLIST_UPDATERS.keys().isdisjoint(playlist_types_to_update) and
+            cls._should_update_base_playlist(name, description, base_playlist_name)
+        ):
+            return 'base-playlist'
+
+        return None
 
     @staticmethod
-    def _should_update_recently_played_recommendations(name: str, playlist_types_to_update: 'list[str]') -> bool:
+    def _should_update_recently_played_recommendations(name: str, playlist_types_to_update: 'frozenset[str]') -> bool:
         """Checks if the recently played playlist needs to be updated.
 
         Args:
             name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
+            playlist_types_to_update (frozenset[str]): Types of playlists to update.
 
         Returns:
             bool: True if the recently played playlist needs to be updated, False otherwise.
@@ -607,12 +641,12 @@ class UserUtil:
         )
 
     @staticmethod
-    def _should_update_recently_played(name: str, playlist_types_to_update: 'list[str]') -> bool:
+    def _should_update_recently_played(name: str, playlist_types_to_update: 'frozenset[str]') -> bool:
         """Checks if the recently played playlist needs to be updated.
 
         Args:
             name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
+            playlist_types_to_update (frozenset[str]): Types of playlists to update.
 
         Returns:
             bool: True if the recently played playlist needs to be updated, False otherwise.
@@ -624,25 +658,82 @@ class UserUtil:
         )
 
     @staticmethod
-    def _should_update_most_listened(name: str, playlist_types_to_update: 'list[str]') -> bool:
+    def _should_update_most_listened(name: str, playlist_types_to_update: 'frozenset[str]') -> bool:
         """Checks if the most listened playlist needs to be updated.
 
         Args:
             name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
+            playlist_types_to_update (frozenset[str]): Types of playlists to update.
 
         Returns:
             bool: True if the most listened playlist needs to be updated, False otherwise.
         """
         return (
             'most-listened-tracks' in playlist_types_to_update and
-            name in {
-                'Long Term Most-listened Tracks',
-                'Medium Term Most-listened Tracks',
-                'Short Term Most-listened Tracks'
-            }
+            name in MOST_LISTENED_PLAYLIST_NAMES
         )
 
+    @staticmethod
+    def _parse_term_time_range(name: str) -> str:
+        """Parses the time range from the name of a playlist that starts with it, e.g. 'Long Term Most-listened Tracks'.
+
+        Args:
+            name (str): The name of the playlist.
+
+        Returns:
+            str: The parsed time range, e.g. 'long_term'.
+        """
+        return '_'.join(name.split(' ')[:2]).lower()
+
+    @staticmethod
+    def _parse_recently_played_time_range(name: str) -> str:
+        """Parses the time range from the name of a recently played songs playlist.
+
+        Args:
+            name (str): The name of the playlist.
+
+        Returns:
+            str: The parsed time range, e.g. 'last-3-hours'.
+        """
+        name_match = RECENTLY_PLAYED_SONGS_PATTERN.search(name)
+
+        if name_match is None:
+            raise ValueError(f'Invalid recently played songs playlist name: {name}')
+
+        return name_match.group(1).replace(' ', '-').lower()
+
+    @staticmethod
+    def _parse_recently_played_recommendations_time_range(name: str) -> str:
+        """Parses the time range from the name of a recently played recommendations playlist.
+
+        Args:
+            name (str): The name of the playlist.
+
+        Returns:
+            str: The parsed time range, e.g. 'last-3-hours'.
+        """
+        name_match = RECENTLY_PLAYED_RECOMMENDATIONS_PATTERN.search(name)
+
+        if name_match is None:
+            raise ValueError(f'Invalid recently played recommendations playlist name: {name}')
+
+        return name_match.group(1).replace(' ', '-').lower()
+
+    @classmethod
+    def _parse_profile_recommendation_time_range(cls, name: str) -> str:
+        """Parses the time range from the name of a profile recommendation playlist. Playlists created before version 4.4.0 have no time range in the name, and are short term.
+
+        Args:
+            name (str): The name of the playlist.
+
+        Returns:
+            str: The parsed time range.
+        """
+        if 'term' in name.lower():
+            return cls._parse_term_time_range(name)
+
+        return 'short_term'
+
     @staticmethod
     def _prepare_profile_recommendation(name: str) -> 'tuple[str, str, str, str]':
         """Prepares the information for a profile recommendation playlist.
@@ -653,28 +744,26 @@ class UserUtil:
         Returns:
             tuple[str, str, str, str]: The criteria, time range, playlist name, and description for the playlist.
         """
-        criteria = name.split('(')[1].split(')')[0]
+        criteria = name.partition('(')[2].partition(')')[0]
         criteria_name = criteria
 
         if ',' in criteria:
             criteria = 'mixed'
 
-        if 'term' in name.lower():
-            time_range = '_'.join(name.split(' ')[:2]).lower()
-        else:
-            time_range = 'short_term'
-        playlist_name = f"{time_range.replace('_', ' ').title()} Profile Recommendation ({criteria_name})"
-        description = f'''{time_range.replace('_', ' ').capitalize()} Profile-based recommendations based on favorite {criteria_name}'''
+        time_range = UserUtil._parse_profile_recommendation_time_range(name)
+        time_range_words = time_range.replace('_', ' ')
+        playlist_name = f"{time_range_words.title()} Profile Recommendation ({criteria_name})"
+        description = f'''{time_range_words.capitalize()} Profile-based recommendations based on favorite {criteria_name}'''
 
         return criteria, time_range, playlist_name, description
 
     @staticmethod
-    def _should_update_profile_recommendation(name: str, playlist_types_to_update: 'list[str]') -> bool:
+    def _should_update_profile_recommendation(name: str, playlist_types_to_update: 'frozenset[str]') -> bool:
         """Checks if the profile recommendation playlist needs to be updated.
 
         Args:
             name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
+            playlist_types_to_update (frozenset[str]): Types of playlists to update.
 
         Returns:
             bool: True if the profile recommendation playlist needs to be updated, False otherwise.
@@ -682,10 +771,7 @@ class UserUtil:
         return (
             'Profile Recommendation' in name and
             ' - 20' not in name and
-            any(
-                playlist_type in playlist_types_to_update
-                for playlist_type in {'short-term-profile-recommendation', 'medium-term-profile-recommendation', 'long-term-profile-recommendation'}
-            )
+            not PROFILE_RECOMMENDATION_PLAYLIST_TYPES.isdisjoint(playlist_types_to_update)
         )
 
     @staticmethod
@@ -702,36 +788,26 @@ class UserUtil:
         """
         return (
             base_playlist_name is not None and
-            (f", within the playlist {base_playlist_name}" in description or not description) and
-            ('Related' in name or 'Mix' in name or 'This once was' in name or 'Playlist Recommendation' in name or 'Songs related to the mood' in description or 'most listened recommendations' in name)
+            (not description or f", within the playlist {base_playlist_name}" in description) and
+            (BASE_PLAYLIST_NAME_MARKERS_PATTERN.search(name) is not None or 'Songs related to the mood' in description)
         )
 
     @staticmethod
-    def _should_update_song_related(name: str, playlist_types_to_update: 'list[str]') -> bool:
-        """Checks if a song related playlist needs to be updated.
-
-        Args:
-            name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
-
-        Returns:
-            bool: True if the song related playlist needs to be updated, False otherwise.
-        """
-        return (re.match(r"\'(.*?)\' Related", name) or re.match(r'\"(.*?)\" Related', name)) and 'song-related' in playlist_types_to_update # type: ignore
-
-    @staticmethod
-    def _update_song_related(base_playlist: BasePlaylist, song_name: str, artist_name: str, total_tracks: int) -> None:
+    def _update_song_related(base_playlist: BasePlaylist, name: str, description: str, total_tracks: int) -> None:
         """Updates a song-related playlist by getting recommendations for a specific song.
 
         Args:
             base_playlist (BasePlaylist): The base playlist object.
-            song_name (str): The name of the song.
-            artist_name (str): The name of the artist.
+            name (str): The name of the playlist.
+            description (str): The description of the playlist.
             total_tracks (int): The total number of tracks in the playlist (excluding the target song).
 
         Returns:
             None
         """
+        song_name = SONG_RELATED_PATTERN.match(name).group(1)  # type: ignore
+        artist_name = description.partition(', within the playlist')[0].partition(' by ')[2]  # partitioning just in case the artist name has " by " in it
+
         base_playlist.get_recommendations_for_song(
             song_name=song_name,
             build_playlist=True,
@@ -742,31 +818,20 @@ class UserUtil:
 
 
     @staticmethod
-    def _should_update_artist_mix(name: str, playlist_types_to_update: 'list[str]') -> bool:
-        """Checks if an artist mix playlist needs to be updated.
-
-        Args:
-            name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
-
-        Returns:
-            bool: True if the artist mix playlist needs to be updated, False otherwise.
-        """
-        return (re.match(r"\'(.*?)\' Mix", name) or re.match(r'\"(.*?)\" Mix', name)) and 'artist-mix' in playlist_types_to_update # type: ignore
-
-
-    @staticmethod
-    def _update_artist_mix(base_playlist: BasePlaylist, artist_name: str, total_tracks: int) -> None:
+    def _update_artist_mix(base_playlist: BasePlaylist, name: str, description: str, total_tracks: int) -> None:
         """Updates an artist mix playlist by creating a playlist based on an artist and related artists.
 
         Args:
             base_playlist (BasePlaylist): The base playlist object.
-            artist_name (str): The name of the artist.
+            name (str): The name of the playlist.
+            description (str): The description of the playlist.
             total_tracks (int): The total number of tracks in the playlist.
 
         Returns:
             None
         """
+        artist_name = ARTIST_MIX_PATTERN.match(name).group(1)  # type: ignore
+
         base_playlist.artist_and_related_playlist(
             build_playlist=True,
             artist_name=artist_name,
@@ -775,54 +840,28 @@ class UserUtil:
 
 
     @staticmethod
-    def _should_update_artist_full(name: str, playlist_types_to_update: 'list[str]') -> bool:
-        """Checks if an artist full playlist needs to be updated.
-
-        Args:
-            name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
-
-        Returns:
-            bool: True if the artist full playlist needs to be updated, False otherwise.
-        """
-        return (re.match(r"This once was \'(.*?)\'", name) or re.match(r'This once was \"(.*?)\"', name)) and 'artist-full' in playlist_types_to_update # type: ignore
-
-
-    @staticmethod
-    def _update_artist_full(base_playlist: BasePlaylist, artist_name: str, total_tracks: int, ensure_all_artist_songs: bool) -> None:
+    def _update_artist_full(base_playlist: BasePlaylist, name: str, description: str, total_tracks: int) -> None:
         """Updates an artist full playlist by creating a playlist containing all songs by an artist.
 
         Args:
             base_playlist (BasePlaylist): The base playlist object.
-            artist_name (str): The name of the artist.
+            name (str): The name of the playlist.
+            description (str): The description of the playlist.
             total_tracks (int): The total number of tracks in the playlist.
-            ensure_all_artist_songs (bool): Flag to ensure all songs by the artist are included.
 
         Returns:
             None
         """
+        artist_name = ARTIST_FULL_PATTERN.match(name).group(1)  # type: ignore
+
         base_playlist.artist_only_playlist(
             build_playlist=True,
             artist_name=artist_name,
             number_of_songs=total_tracks,
-            ensure_all_artist_songs=ensure_all_artist_songs,
+            ensure_all_artist_songs=f'All {artist_name}' in description or not description,
         )
 
 
-    @staticmethod
-    def _should_update_playlist_recommendation(name: str, playlist_types_to_update: 'list[str]') -> bool:
-        """Checks if a playlist recommendation playlist needs to be updated.
-
-        Args:
-            name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
-
-        Returns:
-            bool: True if the playlist recommendation playlist needs to be updated, False otherwise.
-        """
-        return 'Playlist Recommendation' in name and ' - 20' not in name and 'playlist-recommendation' in playlist_types_to_update
-
-
     @staticmethod
     def _parse_playlist_recommendation(name: str) -> 'tuple[str, str]':
         """Parses the criteria and time range from a playlist recommendation playlist name.
@@ -833,28 +872,30 @@ class UserUtil:
         Returns:
             tuple[str, str]: The parsed criteria and time range.
         """
-        criteria = name.split('(')[1].split(')')[0]
+        criteria = name.partition('(')[2].partition(')')[0]
         if ',' in criteria:
             criteria = 'mixed'
 
-        time_range = 'all_time' if 'for all_time' in name else name.split('for the last')[-1].split('(')[0].strip()
+        time_range = 'all_time' if 'for all_time' in name else name.rpartition('for the last')[2].partition('(')[0].strip()
 
         return criteria, time_range
 
 
     @staticmethod
-    def _update_playlist_recommendation(base_playlist: BasePlaylist, time_range: str, criteria: str, total_tracks: int) -> None:
+    def _update_playlist_recommendation(base_playlist: BasePlaylist, name: str, description: str, total_tracks: int) -> None:
         """Updates a playlist recommendation playlist by getting recommendations based on criteria and time range.
 
         Args:
             base_playlist (BasePlaylist): The base playlist object.
-            time_range (str): The time range for the playlist.
-            criteria (str): The criteria for the recommendations.
+            name (str): The name of the playlist.
+            description (str): The description of the playlist.
             total_tracks (int): The total number of tracks in the playlist.
 
         Returns:
             None
         """
+        criteria, time_range = UserUtil._parse_playlist_recommendation(name)
+
         base_playlist.get_playlist_recommendation(
             build_playlist=True,
             time_range=time_range,
@@ -864,61 +905,34 @@ class UserUtil:
 
 
     @staticmethod
-    def _should_update_songs_by_mood(description: str, playlist_types_to_update: 'list[str]') -> bool:
-        """Checks if a songs by mood playlist needs to be updated.
-
-        Args:
-            description (str): The description of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
-
-        Returns:
-            bool: True if the songs by mood playlist needs to be updated, False otherwise.
-        """
-        return 'Songs related to the mood' in description and 'mood' in playlist_types_to_update
-
-
-    @staticmethod
-    def _update_songs_by_mood(base_playlist: BasePlaylist, mood: str, total_tracks: int, exclude_mostly_instrumental: bool) -> None:
+    def _update_songs_by_mood(base_playlist: BasePlaylist, name: str, description: str, total_tracks: int) -> None:
         """Updates a songs by mood playlist by getting songs related to a specific mood.
 
         Args:
             base_playlist (BasePlaylist): The base playlist object.
-            mood (str): The mood to search for.
+            name (str): The name of the playlist.
+            description (str): The description of the playlist.
             total_tracks (int): The total number of tracks in the playlist.
-            exclude_mostly_instrumental (bool): Flag to exclude mostly instrumental tracks.
 
         Returns:
             None
         """
         base_playlist.get_songs_by_mood(
-            mood=mood,
             build_playlist=True,
             number_of_songs=total_tracks,
-            exclude_mostly_instrumental=exclude_mostly_instrumental,
+            mood=' '.join(name.split(' ')[:-1]).lower(),
+            exclude_mostly_instrumental='excluding the mostly instrumental songs' in description,
         )
 
 
     @staticmethod
-    def _should_update_most_listened_recommendation(name: str, playlist_types_to_update: 'list[str]') -> bool:
-        """Checks if a most listened recommendation playlist needs to be updated.
-
-        Args:
-            name (str): The name of the playlist.
-            playlist_types_to_update (list[str]): Types of playlists to update.
-
-        Returns:
-            bool: True if the most listened recommendation playlist needs to be updated, False otherwise.
-        """
-        return 'most listened recommendations' in name and 'most-listened-recommendation' in playlist_types_to_update
-
-
-    @staticmethod
-    def _update_most_listened_recommendation(base_playlist: BasePlaylist, time_range: str, total_tracks: int) -> None:
+    def _update_most_listened_recommendation(base_playlist: BasePlaylist, name: str, description: str, total_tracks: int) -> None:
         """Updates a most listened recommendation playlist by getting recommendations based on most listened tracks.
 
         Args:
             base_playlist (BasePlaylist): The base playlist object.
-            time_range (str): The time range for the most listened tracks.
+            name (str): The name of the playlist.
+            description (str): The description of the playlist.
             total_tracks (int): The total number of tracks in the playlist.
 
         Returns:
@@ -926,7 +940,7 @@ class UserUtil:
         """
         base_playlist.playlist_songs_based_on_most_listened_tracks(
             build_playlist=True,
-            time_range=time_range,
+            time_range=UserUtil._parse_term_time_range(name),
             number_of_songs=total_tracks,
         )
 
@@ -940,34 +954,10 @@ class UserUtil:
         Returns:
             timedelta: The timedelta from the time range.
         """
-        if time_range == 'last-30-minutes':
-            return datetime.timedelta(minutes=30)
-        if time_range == 'last-hour':
-            return datetime.timedelta(hours=1)
-        if time_range == 'last-3-hours':
-            return datetime.timedelta(hours=3)
-        if time_range == 'last-6-hours':
-            return datetime.timedelta(hours=6)
-        if time_range == 'last-12-hours':
-            return datetime.timedelta(hours=12)
-        if time_range == 'last-day':
-            return datetime.timedelta(days=1)
-        if time_range == 'last-3-days':
-            return datetime.timedelta(days=3)
-        if time_range == 'last-week':
-            return datetime.timedelta(weeks=1)
-        if time_range == 'last-2-weeks':
-            return datetime.timedelta(weeks=2)
-        if time_range == 'last-month':
-            return datetime.timedelta(days=30)
-        if time_range == 'last-3-months':
-            return datetime.timedelta(days=90)
-        if time_range == 'last-6-months':
-            return datetime.timedelta(days=180)
-        if time_range == 'last-year':
-            return datetime.timedelta(days=365)
-
-        raise ValueError("Invalid time range")
+        try:
+            return RECENTLY_PLAYED_TIME_RANGE_DELTAS[time_range]
+        except KeyError:
+            raise ValueError("Invalid time range") from None
 
 
     @classmethod
@@ -984,7 +974,26 @@ class UserUtil:
 
         after = now - cls._get_timedelta_from_time_range(time_range)
 
-        return int(time.mktime(after.timetuple()) * 1_000), int(time.mktime(now.timetuple()) * 1_000)
+        return int(after.timestamp() * 1_000), int(now.timestamp() * 1_000)
+
+    @staticmethod
+    def _parse_played_at(played_at: str) -> int:
+        """Parses the time a song was played at, as returned by the API in UTC, into a local timestamp.
+
+        Args:
+            played_at (str): The ISO 8601 time the song was played at, e.g. '2023-01-01T12:00:00.000Z'.
+
+        Returns:
+            int: The local timestamp in milliseconds.
+        """
+        played_at = played_at.replace('Z', '')
+
+        try:
+            played_at_datetime = datetime.datetime.fromisoformat(played_at)
+        except ValueError:  # before python 3.11, fromisoformat only accepts 3 or 6 fractional second digits
+            played_at_datetime = datetime.datetime.strptime(played_at, '%Y-%m-%dT%H:%M:%S.%f')
+
+        return int((played_at_datetime + TIME_OFFSET_DELTA).timestamp() * 1_000)
 
     @classmethod
     def get_recently_played_songs(cls, after: int, limit: int, before: Union[int, None] = None, _auto: bool = False) -> 'list[dict[str, str]]':
@@ -999,11 +1008,11 @@ class UserUtil:
         """
 
         songs = []
+        song_ids = set()
         stop = False
 
         while not stop:
             song_batch = []
-            song_ids_set = {song['id'] for song in songs}
             if len(songs) >= limit:
                 break
 
@@ -1018,31 +1027,22 @@ class UserUtil:
                 break
 
             for song in items:
-                song_id, name, popularity, artists, added_at, genres = Song.song_data_batch(song)
+                # the repeated and out of range songs are skipped before song_data_batch, which requests the artists genres
+                song_id = song['track']['id'] if 'track' in song else song['id']
 
-                if song_id in song_ids_set or song_id in [song['id'] for song in song_batch]:
+                if song_id in song_ids or cls._parse_played_at(song['played_at']) < after:
                     continue
 
-                played_at = datetime.datetime.strptime(song['played_at'].replace('Z', ''), '%Y-%m-%dT%H:%M:%S.%f')
-
-                if TIME_OFFSET:
-                    if TIME_OFFSET > 0:
-                        played_at += datetime.timedelta(hours=TIME_OFFSET)
-                    else:
-                        played_at -= datetime.timedelta(hours=abs(TIME_OFFSET))
-
-                played_at = int(time.mktime(played_at.timetuple()) * 1_000)
-
-                if played_at < after:
-                    continue
+                _, name, popularity, artists, added_at, genres = Song.song_data_batch(song)
 
+                song_ids.add(song_id)
                 song_batch.append({
                     'name': name,
                     'id': song_id,
                     'genres': genres,
                     'added_at': added_at,
                     'popularity': popularity,
-                    'artists': list(artists),
+                    'artists': artists,
                 })
 
             if not song_batch:
@@ -1055,8 +1055,7 @@ class UserUtil:
             for offset in range(0, len(songs_ids), 100):
                 songs_audio_features += Song.batch_query_audio_features(songs_ids[offset:offset + 100])
 
-            for song, song_audio_features in zip(song_batch, songs_audio_features):
-                song.update(song_audio_features)
+            song_batch = [{**song, **song_audio_features} for song, song_audio_features in zip(song_batch, songs_audio_features)]
 
             songs += song_batch
 
@@ -1067,8 +1066,9 @@ class UserUtil:
             if _auto:
                 logging.debug(
                     'The number of recently played songs is less than the limit, '
-                    f'due to there being less than {limit} songs played in the selected time range. '
-                    f'Returning {len(songs)} songs'
+                    'due to there being less than %d songs played in the selected time range. '
+                    'Returning %d songs',
+                    limit, len(songs)
                 )
             else:
                 logging.info(
@@ -1080,10 +1080,12 @@ class UserUtil:
 
     @staticmethod
     def _build_playlist_df(data: 'list[dict[str,]]', build_playlist: bool, playlist_type: str, user_id: str, **kwargs) -> pd.DataFrame:
-        dataframe = pd.DataFrame(data)
-        ids = dataframe['id'].drop_duplicates().tolist()
+        # every song dict is built with the same keys, so the columns are assembled directly instead of letting pandas infer them row by row
+        dataframe = pd.DataFrame({column: [song[column] for song in data] for column in data[0]})
 
         if build_playlist:
+            ids = list(dict.fromkeys(song['id'] for song in data))  # deduplicates keeping the first occurrence order
+
             Library.write_playlist(
                 ids=ids,
                 user_id=user_id,
@@ -1095,7 +1097,7 @@ class UserUtil:
 
 
     @classmethod
-    def _get_recently_played_artists_genres(cls, time_range: str) -> 'tuple[list[str], list[str]]':
+    def _get_recently_played_artists_genres(cls, time_range: str) -> 'tuple[Counter[str], Counter[str]]':
         """Gets the top artists and genres based on the main criteria and time range.
 
         Args:
@@ -1103,10 +1105,10 @@ class UserUtil:
             time_range (str): The time range to get the profile most listened information from.
 
         Returns:
-            tuple[list[str], list[str]]: List of artist IDs and genres.
+            tuple[Counter[str], Counter[str]]: Play counts of the artist IDs and genres.
         """
-        genres = []
-        artists = []
+        genres = Counter()
+        artists = Counter()
         stop = False
 
         after, before = UserUtil._get_timestamp_from_time_range(time_range)
@@ -1122,17 +1124,11 @@ class UserUtil:
             if not items:
                 break
 
-            for song in items:
+            songs_artists = []
 
-                played_at = datetime.datetime.strptime(song['played_at'].replace('Z', ''), '%Y-%m-%dT%H:%M:%S.%f')
-
-                if TIME_OFFSET:
-                    if TIME_OFFSET > 0:
-                        played_at += datetime.timedelta(hours=TIME_OFFSET)
-                    else:
-                        played_at -= datetime.timedelta(hours=abs(TIME_OFFSET))
+            for song in items:
 
-                played_at = int(time.mktime(played_at.timetuple()) * 1_000)
+                played_at = cls._parse_played_at(song['played_at'])
 
                 if played_at < after:
                     continue
@@ -1140,11 +1136,14 @@ class UserUtil:
                 if "track" in song:
                     song = song['track']
 
-                artists_temp = [artist['id'] for artist in song.get("artists", [])]
-                genres_temp = Artist.get_artists_genres(artists_temp)
+                songs_artists.append([artist['id'] for artist in song.get("artists", [])])
+
+            # the genres of every artist in the page are requested at once, instead of once per song
+            genres_by_artist = Artist.get_genres_by_artist(list({artist for song_artists in songs_artists for artist in song_artists}))
 
-                artists += artists_temp
-                genres += genres_temp
+            for song_artists in songs_artists:
+                artists.update(song_artists)
+                genres.update({genre for artist in song_artists for genre in genres_by_artist.get(artist, [])})
 
             before = int(recently_played.get('cursors', {}).get('after'))
 
@@ -1157,4 +1156,14 @@ class UserUtil:
         Returns:
             dict: The user's profile.
         """
-        return UserHandler.get_user_profile().json()
\ No newline at end of file
+        return UserHandler.get_user_profile().json()
+
+
+BASE_PLAYLIST_UPDATERS = {
+    'song-related': UserUtil._update_song_related,
+    'artist-mix': UserUtil._update_artist_mix,
+    'artist-full': UserUtil._update_artist_full,
+    'playlist-recommendation': UserUtil._update_playlist_recommendation,
+    'mood': UserUtil._update_songs_by_mood,
+    'most-listened-recommendation': UserUtil._update_most_listened_recommendation,
+}
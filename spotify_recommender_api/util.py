@@ -7,7 +7,7 @@ import functools
 
 from dateutil.tz                      import tzutc
 from spotify_recommender_api.requests import PlaylistHandler
-from typing                           import Any, Callable, Union
+from typing                           import Any, Callable, Sequence, Union
 
 
 def get_time_offset() -> int:
@@ -210,4 +210,18 @@ def chunk_list(input_list: list, chunk_size: int) -> 'list[list]':
     Returns:
         list[list]: divided list
     """
-    return [input_list[i:i+chunk_size] for i in range(0, len(input_list), chunk_size)]
\ No newline at end of file
+    return [input_list[i:i+chunk_size] for i in range(0, len(input_list), chunk_size)]
+
+def join_with_and(items: 'Sequence[str]') -> str:
+    """Function to join a sequence of strings in a human readable way, e.g. 'a, b and c'
+
+    Args:
+        items (Sequence[str]): strings to be joined
+
+    Returns:
+        str: joined string
+    """
+    if len(items) == 1:
+        return items[0]
+
+    return f'{", ".join(items[:-1])} and {items[-1]}'